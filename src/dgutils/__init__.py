@@ -1,6 +1,33 @@
-from dgutils.actions import Actions
-from dgutils.linker import Linker
-from dgutils.schema import Schema
-from dgutils.singleton import GSingleton, Singleton
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from dgutils.actions import Actions
+  from dgutils.linker import Linker
+  from dgutils.schema import Schema
+  from dgutils.singleton import GSingleton, Singleton
 
 __all__ = ["Actions", "GSingleton", "Linker", "Schema", "Singleton"]
+
+# Public name -> module it lives in. Modules are imported on first attribute access
+# (PEP 562), so `import dgutils` doesn't pay for GTK, YAML, etc. until they are used
+_LAZY_EXPORTS = {
+  "Actions": "dgutils.actions",
+  "GSingleton": "dgutils.singleton",
+  "Linker": "dgutils.linker",
+  "Schema": "dgutils.schema",
+  "Singleton": "dgutils.singleton",
+}
+
+
+def __getattr__(name: str) -> object:
+  module_name = _LAZY_EXPORTS.get(name)
+  if module_name is None:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+  value = getattr(importlib.import_module(module_name), name)
+  globals()[name] = value
+  return value
+
+
+def __dir__() -> list[str]:
+  return sorted({*globals(), *__all__})
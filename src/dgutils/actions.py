@@ -1,16 +1,85 @@
 import collections.abc
-import json
+import sys
 from functools import wraps
-from typing import Callable
+from operator import attrgetter
+from threading import Lock
+from typing import Callable, Optional
 
 import gi
-import yaml
 
 gi.require_version("Gio", "2.0")
 gi.require_version("GLib", "2.0")
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gio, GLib, Gtk
 
+# (path, encoding) -> compiled action plan. Only plans are kept, so the parsed schema
+# tree of every resource is garbage right after compilation
+_PLAN_CACHE: dict[tuple[str, str], tuple] = {}
+_PLAN_CACHE_LOCK = Lock()
+
+
+def _load_schema(path: str, encoding: str) -> dict:
+  """Load and parse a GResource actions schema"""
+  # Read straight from the registered resource section, without a GFile/VFS roundtrip
+  contents = Gio.resources_lookup_data(path, Gio.ResourceLookupFlags.NONE).get_data()
+  # Parsers are imported on first use so `import dgutils` stays cheap
+  if encoding == "yaml":
+    import yaml
+
+    try:
+      from yaml import CSafeLoader as Loader
+    except ImportError:  # PyYAML built without LibYAML
+      from yaml import SafeLoader as Loader
+
+    return yaml.load(contents, Loader=Loader)
+
+  import json
+
+  return json.loads(contents)
+
+
+def _run_plan(instance: Gtk.Widget, plan: tuple) -> None:
+  """Wire a compiled action plan (see `Actions._compile`) onto the given instance"""
+  for group_name, actions, shortcuts in plan:
+    action_group = Gio.SimpleActionGroup.new()
+
+    for name, callback_name, getter, parameter_type, args, dynamic_args in actions:
+      callback = _resolve_callback(instance, callback_name, getter)
+      gio_action = Gio.SimpleAction.new(name, parameter_type)
+      if dynamic_args:
+        args = _resolve_args(instance, args)
+
+      # Callbacks are resolved on the instance (bound methods) and user data is stored in
+      # the GClosure itself, so wrapping them (e.g. in `functools.partial`) would only
+      # add a call layer on every activation
+      gio_action.connect("activate", callback, *args)
+      action_group.add_action(gio_action)
+
+    # Inserted only once fully populated, so the per-action `action-added` emissions
+    # above have no listeners yet and the widget's action muxer is updated once
+    instance.insert_action_group(group_name, action_group)
+
+    # Groups without shortcuts never allocate a controller
+    if shortcuts:
+      shortcut_controller = Gtk.ShortcutController()
+      for trigger, detailed_name in shortcuts:
+        shortcut_controller.add_shortcut(
+          Gtk.Shortcut.new(trigger=trigger, action=Gtk.NamedAction.new(detailed_name))
+        )
+      instance.add_controller(shortcut_controller)
+
+
+def _resolve_callback(instance: object, dotted: str, getter: attrgetter) -> Callable:
+  obj = getter(instance)
+  if isinstance(obj, collections.abc.Callable):
+    return obj
+  raise TypeError(f"Resolved object '{dotted}' is not callable")
+
+
+def _resolve_args(instance: object, args: tuple) -> list:
+  # `self.X.Y` arguments were compiled into attribute getters, the rest are literals
+  return [arg(instance) if isinstance(arg, attrgetter) else arg for arg in args]
+
 
 class Actions:
   """Create Gio.SimpleAction(+shortcuts) from a GResource schema.
@@ -23,82 +92,90 @@ class Actions:
       class MyWidget(...): ...
   """
 
-  def __init__(self, instance, schema: dict) -> None:
+  # Accelerator string -> parsed trigger. Triggers are immutable, so one parsed trigger
+  # is safely shared by every `Gtk.Shortcut` using the same accelerator
+  _shortcut_trigger_cache: dict[str, Gtk.ShortcutTrigger] = {}
+
+  def __init__(self, instance, schema: dict, plan: Optional[tuple] = None) -> None:
     self.instance = instance
     self.schema = schema
-    self._setup()
+    self._setup(plan if plan is not None else self._compile(schema))
 
-  def _setup(self):
-    for group_name, actions in self.schema.get("groups", {}).items():
-      action_group = Gio.SimpleActionGroup.new()
-      shortcut_controller = Gtk.ShortcutController()
-      has_shortcuts = False  # GTK may not expose get_shortcuts(); track ourselves
+  @classmethod
+  def _compile(cls, schema: dict) -> tuple:
+    """Compile a raw actions schema into an immutable action plan.
 
+    Everything that depends only on the schema (attribute getters for dotted paths,
+    parameter types, shortcut triggers) is done here once, leaving only GObject wiring
+    per instance.
+    """
+    plan = []
+    for raw_group_name, actions in schema.get("groups", {}).items():
+      # Plan strings live as long as the process and repeat across schemas and
+      # instances, so keep a single interned copy of each. `attrgetter` interns
+      # attribute names by itself
+      group_name = sys.intern(raw_group_name)
+      group_plan = []
+      group_shortcuts = []
       for action in actions:
         action: dict
-        name = action["name"]
-        callback_name: str = action["callback"]
-        parameter_type: str = action.get("parameter-type", None)
-        callback = self._resolve_callback(callback_name)
-
-        gio_action = Gio.SimpleAction.new(
-          name, None if not parameter_type else GLib.VariantType.new(parameter_type)
+        name = sys.intern(action["name"])
+        callback_name: str = action["callback"].removeprefix("self.")
+        parameter_type: Optional[str] = action.get("parameter-type", None)
+        shortcut: Optional[str] = action.get("shortcut")
+        args = tuple(
+          attrgetter(arg[5:])
+          if isinstance(arg, str) and arg.startswith("self.")
+          else arg
+          for arg in action.get("with_args", [])
         )
 
-        raw_args: list[str] = action.get("with_args", [])
-        resolved_args = self._resolve_args(raw_args)
+        group_plan.append(
+          (
+            name,
+            callback_name,
+            attrgetter(callback_name),
+            GLib.VariantType.new(parameter_type) if parameter_type else None,
+            args,
+            # Literal-only args are used as is, without per-instance resolution
+            any(isinstance(arg, attrgetter) for arg in args),
+          )
+        )
+        if shortcut:
+          detailed_name = sys.intern(f"{group_name}.{name}")
+          group_shortcuts.append((cls._parse_trigger(shortcut), detailed_name))
+      plan.append((group_name, tuple(group_plan), tuple(group_shortcuts)))
+    return tuple(plan)
 
-        if resolved_args:
-          gio_action.connect("activate", callback, *resolved_args)
-        else:
-          gio_action.connect("activate", callback)
+  @classmethod
+  def _load_plan(cls, path: str, encoding: str) -> tuple:
+    """Returns the compiled plan of a GResource schema, loading it once per process"""
+    key = (path, encoding)
+    with _PLAN_CACHE_LOCK:
+      plan = _PLAN_CACHE.get(key)
+      if plan is None:
+        plan = _PLAN_CACHE[key] = cls._compile(_load_schema(path, encoding))
+      return plan
 
-        action_group.add_action(gio_action)
+  @classmethod
+  def _parse_trigger(cls, shortcut: str) -> Gtk.ShortcutTrigger:
+    trigger = cls._shortcut_trigger_cache.get(shortcut)
+    if trigger is None:
+      trigger = cls._shortcut_trigger_cache.setdefault(
+        shortcut, Gtk.ShortcutTrigger.parse_string(shortcut)
+      )
+    return trigger
 
-        if shortcut := action.get("shortcut"):
-          shortcut_controller.add_shortcut(
-            Gtk.Shortcut.new(
-              trigger=Gtk.ShortcutTrigger.parse_string(shortcut),
-              action=Gtk.NamedAction.new(f"{group_name}.{name}"),
-            )
-          )
-          has_shortcuts = True
-
-      self.instance.insert_action_group(group_name, action_group)
-      if has_shortcuts:
-        self.instance.add_controller(shortcut_controller)
-
-  def _resolve_callback(self, dotted: str) -> Callable:
-    parts = dotted.split(".")
-    obj = self.instance
-    if parts and parts[0] == "self":
-      parts = parts[1:]
-    for part in parts:
-      obj = getattr(obj, part)
-    if isinstance(obj, collections.abc.Callable):
-      return obj
-    raise TypeError(f"Resolved object '{dotted}' is not callable")
-
-  def _resolve_args(self, raw_args: list[str]):
-    out = []
-    for a in raw_args:
-      if isinstance(a, str) and a.startswith("self."):
-        out.append(self._resolve_attr_chain(self.instance, a[5:]))
-      else:
-        out.append(a)
-    return out
-
-  @staticmethod
-  def _resolve_attr_chain(root, dotted: str):
-    obj = root
-    for part in dotted.split("."):
-      obj = getattr(obj, part)
-    return obj
+  def _setup(self, plan: tuple) -> None:
+    _run_plan(self.instance, plan)
 
   @classmethod
   def from_schema[T](cls, path: str, encoding: str = "yaml") -> Callable[[type[T]], type[T]]:
     """Create a class decorator from a GResource actions schema.
 
+    The schema is loaded and compiled when the class is decorated, so the GResource
+    must already be registered at that point (the same as for `Gtk.Template`).
+
     Parameters
     ----------
     path : str
@@ -115,20 +192,17 @@ class Actions:
     def class_decorator(target_cls):
       original_init = target_cls.__init__
 
+      # Load schema from GResource and compile it once for the whole class
+      plan = cls._load_plan(path, encoding)
+      target_cls._dgutils_action_plan = plan  # noqa: SLF001
+
       @wraps(original_init)
       def new_init(self, *args, **kwargs):
         # Run original constructor first
         original_init(self, *args, **kwargs)
 
-        # Load schema from GResource
-        gfile = Gio.File.new_for_uri(f"resource://{path}")
-        contents = gfile.load_contents(None)[1].decode("utf-8")
-        schema = (
-          yaml.safe_load(contents) if encoding == "yaml" else json.loads(contents)
-        )
-
         # Build actions/shortcuts on this instance
-        cls(self, schema)
+        _run_plan(self, plan)
 
       target_cls.__init__ = new_init
       return target_cls
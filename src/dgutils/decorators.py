@@ -11,42 +11,90 @@ from dgutils.exceptions import (
 
 
 def errsingleton[T: type](cls: T) -> T:
-  """Raises a `SingletonInstantiation` exception when trying to instantiate twice."""
-  instance = None
-  has_instance = False
-  lock = Lock()
+  """Raises a `SingletonInstantiation` exception when trying to instantiate twice.
 
-  def get_instance(*args, **kwargs):
-    nonlocal instance, has_instance
+  The decorated class stays a real class, so `isinstance` checks, staticmethods and
+  classmethods keep working. It is also made `final`, since subclasses would share its
+  single instance.
+  """
+  original_new = cls.__new__
+  original_init = cls.__init__
+  takes_no_args = original_new is object.__new__ and original_init is object.__init__
+  lock = Lock()
+  cls._singleton_instance = None  # ty:ignore[unresolved-attribute]
+
+  def __new__(klass: type, *args, **kwargs):  # noqa: N807
+    if takes_no_args and (args or kwargs):
+      raise TypeError(f"{cls.__name__}() takes no arguments")
+    # Once instantiated, fail without touching the lock
+    if cls._singleton_instance is not None:
+      raise SingletonInstantiation(f"{cls.__name__} can only be instantiated once.")
     with lock:
-      if has_instance:
+      if cls._singleton_instance is not None:
         raise SingletonInstantiation(f"{cls.__name__} can only be instantiated once.")
-      instance = cls(*args, **kwargs)
-      has_instance = True
+      instance = (
+        original_new(klass)
+        if original_new is object.__new__
+        else original_new(klass, *args, **kwargs)
+      )
+      cls._singleton_instance = instance
       return instance
 
-  return get_instance()
+  def __init__(self: object, *args, **kwargs):  # noqa: N807
+    try:
+      if original_init is object.__init__:
+        original_init(self)
+      else:
+        cast("Callable[..., None]", original_init)(self, *args, **kwargs)
+    except BaseException:
+      # Not instantiated after all, so a later attempt may succeed
+      cls._singleton_instance = None
+      raise
+
+  cls.__new__ = __new__  # ty:ignore[invalid-assignment]
+  cls.__init__ = __init__  # ty:ignore[invalid-assignment]
+  return final(cls)
 
 
 def singleton[T: type](cls: T) -> T:
   """Returns an already created instance on second instantiation.
 
-  Simple singleton realizations. Disables support for staticmethods and classmethods,
-  since calling class only possible with using parenthesis.
+  The decorated class stays a real class, so `isinstance` checks, staticmethods and
+  classmethods keep working. `__init__` runs only once, for the first instantiation.
+  The class is also made `final`, since subclasses would share its single instance.
 
-  If your class has static or class methods, consider using `Singleton` metaclass, or
-  `GSingleton` metaclass for GObject classes.
+  For GObject classes consider using `GSingleton` metaclass.
   """
-  instances = {}
+  original_new = cls.__new__
+  original_init = cls.__init__
+  takes_no_args = original_new is object.__new__ and original_init is object.__init__
   lock = Lock()
+  cls._singleton_instance = None  # ty:ignore[unresolved-attribute]
 
-  def get_instance(*args, **kwargs):
+  def __new__(klass: type, *args, **kwargs):  # noqa: N807
+    # Lock-free steady state: a single attribute load, the lock only guards construction
+    instance = cls._singleton_instance
+    if instance is not None:
+      return instance
+    if takes_no_args and (args or kwargs):
+      raise TypeError(f"{cls.__name__}() takes no arguments")
     with lock:
-      if cls not in instances:
-        instances[cls] = cls(*args, **kwargs)
-      return instances[cls]
+      if cls._singleton_instance is None:
+        instance = (
+          original_new(klass)
+          if original_new is object.__new__
+          else original_new(klass, *args, **kwargs)
+        )
+        cast("Callable[..., None]", original_init)(instance, *args, **kwargs)
+        cls._singleton_instance = instance
+      return cls._singleton_instance
 
-  return get_instance()
+  def __init__(self: object, *args, **kwargs):  # noqa: N807
+    """Already initialized by `__new__` on first instantiation"""
+
+  cls.__new__ = __new__  # ty:ignore[invalid-assignment]
+  cls.__init__ = __init__  # ty:ignore[invalid-assignment]
+  return final(cls)
 
 
 def final[T: type](cls: T) -> T:
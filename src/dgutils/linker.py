@@ -1,7 +1,18 @@
 import weakref
 from typing import Callable
 
-from gi.repository import GObject, Gtk
+from gi.repository import GObject
+
+
+class _ObjectRef(weakref.ref):
+  """Weak reference to a tracked GObject carrying its connections bookkeeping"""
+
+  __slots__ = ("handlers", "key")
+
+  def __init__(self, gobject: GObject.Object, callback: Callable) -> None:
+    super().__init__(gobject, callback)
+    self.key = id(gobject)
+    self.handlers: list[int] = []
 
 
 class Linker:
@@ -14,9 +25,16 @@ class Linker:
 
   def __init__(self) -> None:
     self._linker_bindings: list[GObject.Binding] = []
-    self._linker_connections: weakref.WeakKeyDictionary[GObject.Object, list[int]] = (
-      weakref.WeakKeyDictionary()
-    )
+    self._linker_connections: dict[int, _ObjectRef] = {}
+    connections = self._linker_connections
+
+    # Single weakref callback shared by every tracked object. It holds the dict, not
+    # `self`, so tracked objects don't keep the Linker alive
+    def prune(ref: _ObjectRef) -> None:
+      if connections.get(ref.key) is ref:
+        del connections[ref.key]
+
+    self._linker_prune = prune
 
   def new_binding(self, binding: GObject.Binding) -> None:
     """Assigns provided Binding to `self` for future unbinding.
@@ -58,20 +76,13 @@ class Linker:
     *args
       User data to pass to `GObject.Object.connect()` method
     """
-
-    def on_gobject_destroyed(gobject: GObject.Object) -> None:
-      handlers = self._linker_connections.pop(gobject, [])
-      for handler_id in handlers:
-        if gobject.handler_is_connected(handler_id):
-          gobject.disconnect(handler_id)
-
-    if gobject not in self._linker_connections:
-      self._linker_connections[gobject] = []
-      if isinstance(gobject, Gtk.Widget):
-        gobject.connect("destroy", on_gobject_destroyed)
+    ref = self._linker_connections.get(id(gobject))
+    if ref is None:
+      ref = _ObjectRef(gobject, self._linker_prune)
+      self._linker_connections[ref.key] = ref
 
     handler = gobject.connect(signal, callback, *args)
-    self._linker_connections[gobject].append(handler)
+    ref.handlers.append(handler)
 
   def unbind_all(self) -> None:
     """Unbinds all bindings"""
@@ -81,8 +92,10 @@ class Linker:
 
   def disconnect_all(self) -> None:
     """Disconnects all connections"""
-    for gobject, handlers in list(self._linker_connections.items()):
-      for handler_id in handlers:
+    for ref in list(self._linker_connections.values()):
+      if (gobject := ref()) is None:
+        continue  # already dead
+      for handler_id in ref.handlers:
         if gobject.handler_is_connected(handler_id):
           gobject.disconnect(handler_id)
     self._linker_connections.clear()
@@ -1,26 +1,125 @@
+import atexit
+import contextlib
+import functools
 import json
-from pathlib import Path
+import math
+import sys
+import weakref
+from collections import defaultdict
+from pathlib import Path, PurePosixPath
 from typing import Any, Callable, Optional, Union
 
 import yaml
-from gi.repository import Gio, GObject
+from gi.repository import Gio, GLib, GObject
 
 type Transform = Callable[[Any], Any]
 type SupportedTypes = Union[bool, str, int, float]
+type LeafValidator = Callable[[Any], tuple[Any, bool]]
+type Validator = Callable[[dict[str, Any]], tuple[dict[str, Any], bool]]
+
+# Rule `type` name -> Python type of valid values
+_TYPE_MAP: dict[str, type] = {"int": int, "str": str, "bool": bool, "float": float}
+
+# Quiet period after the last `Schema.set()` before changes are written to disk
+_SAVE_DELAY_MS = 150
+
+# Schemas flushed on interpreter exit. Held weakly, so registering doesn't keep them alive
+_live_schemas: "weakref.WeakSet[Schema]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_schemas() -> None:
+  for schema in tuple(_live_schemas):
+    schema.flush()
+
+
+try:
+  from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+  from yaml import SafeLoader as _YamlLoader
+
+
+def _json_dumps(data: dict[str, Any]) -> bytes:
+  # Indentation switches the stdlib encoder to its pure-Python implementation
+  return json.dumps(data, separators=(",", ":")).encode()
+
+
+try:
+  import orjson
+except ImportError:
+  _loads = json.loads
+  _dumps = _json_dumps
+else:
+  # Non-str keys (YAML parses `on:`, `1:` as bool/int) are coerced the same way as by
+  # the stdlib encoder
+  _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+  def _loads(data: Union[bytes, str]) -> Any:
+    try:
+      return orjson.loads(data)
+    except orjson.JSONDecodeError:
+      # `NaN`/`Infinity` written by the stdlib encoder are accepted by its decoder only
+      return json.loads(data)
+
+  def _has_non_finite(value: Any) -> bool:
+    if type(value) is float:
+      return not math.isfinite(value)
+    if isinstance(value, dict):
+      return any(map(_has_non_finite, value.values()))
+    if isinstance(value, list):
+      return any(map(_has_non_finite, value))
+    return False
+
+  def _dumps(data: dict[str, Any]) -> bytes:
+    # orjson writes non-finite floats as `null`, the stdlib encoder keeps them
+    if _has_non_finite(data):
+      return _json_dumps(data)
+    try:
+      return orjson.dumps(data, option=_ORJSON_OPTIONS)
+    except TypeError:  # e.g. an integer out of the 64-bit range
+      return _json_dumps(data)
+
+
+def _msgpack_codec() -> tuple[Callable[[bytes], Any], Callable[[Any], bytes]]:
+  # Imported only when requested, msgspec is an optional dependency
+  import msgspec
+
+  return msgspec.msgpack.decode, msgspec.msgpack.encode
 
 
 class Schema(GObject.GObject):
-  __gsignals__ = {"changed": (GObject.SignalFlags.RUN_FIRST, None, (str, object))}
+  __gsignals__ = {
+    "changed": (GObject.SignalFlags.RUN_FIRST, None, (str, object)),
+    # Emitted once per `set_many()` with a `{dotted_path: value}` dict of changed keys
+    "changed-bulk": (GObject.SignalFlags.RUN_FIRST, None, (object,)),
+  }
 
-  def __init__(self, default_schema_resource: str, user_schema_path: Path) -> None:
+  def __init__(
+    self,
+    default_schema_resource: str,
+    user_schema_path: Path,
+    *,
+    binary_format: bool = False,
+  ) -> None:
     super().__init__()
     self._rules = self._load_yaml_from_resource(default_schema_resource)
     self._path = user_schema_path
-    self._data = self._load_or_create_user_data(self._path)
-    corrected, changed = self._apply_validation_and_cleanup(self._data, self._rules)
-    self._data = corrected
-    if changed:
+    # MessagePack is smaller and faster to write, JSON stays the default for readability
+    self._loads, self._dumps = _msgpack_codec() if binary_format else (_loads, _dumps)
+    self._save_source = 0
+    # dotted path -> callbacks of bindings to it, called directly instead of filtering
+    # every `changed` emission in every binding
+    self._subs: defaultdict[str, list[Callable[[Any], None]]] = defaultdict(list)
+    # dotted path -> leaf validator, filled while compiling the rules
+    self._flat_rules: dict[str, LeafValidator] = {}
+    self._validator = _compile_validator(self._rules, self._flat_rules)
+    # dotted path -> (parent group, key) of resolved leaves
+    self._leaf_nodes: dict[str, tuple[dict[str, Any], str]] = {}
+    data, convert = self._load_or_create_user_data(self._path)
+    self._data, changed = self._validator(data if isinstance(data, dict) else {})
+    if changed or convert:
       self._save()
+    _live_schemas.add(self)
 
   def get(self, dotted_path: str) -> SupportedTypes:
     """Returns a value assigned to a given schema keypath
@@ -35,7 +134,7 @@ class Schema(GObject.GObject):
     Any
       Value of the keypath
     """
-    node, key = self._resolve_parent_and_key(self._data, dotted_path)
+    node, key = self._resolve(dotted_path)
     return node[key]
 
   def set(self, dotted_path: str, value: SupportedTypes) -> None:
@@ -48,14 +147,63 @@ class Schema(GObject.GObject):
     value : Any
       Value
     """
-    valid_value = self._validate_single_value(dotted_path, value)
-    node, key = self._resolve_parent_and_key(self._data, dotted_path)
-    if node.get(key) != valid_value:
-      node[key] = valid_value
+    node, key = self._resolve(dotted_path)
+    self._set_resolved(dotted_path, node, key, value)
+
+  def set_many(self, updates: dict[str, SupportedTypes]) -> None:
+    """Sets given values to given keypaths as a single update
+
+    Every keypath is resolved and every value is validated before anything is stored,
+    so an invalid keypath leaves the schema untouched. Bindings and `changed` handlers
+    are notified once all values are stored, followed by a single `changed-bulk`
+    emission with all changed keys, for handlers that react to the update as a whole
+
+    Parameters
+    ----------
+    updates : dict[str, Any]
+      path.to.the.key -> value mapping
+
+    Raises
+    ------
+    KeyError
+      Raised if any of the keypaths isn't a schema key
+    """
+    staged = []
+    for dotted_path, value in updates.items():
+      node, key = self._resolve(dotted_path)
+      staged.append(
+        (dotted_path, node, key, self._validate_single_value(dotted_path, value))
+      )
+
+    changes: dict[str, Any] = {}
+    for dotted_path, node, key, valid_value in staged:
+      # Not a comprehension: `_store()` writes the value as a side effect
+      if self._store(node, key, valid_value):
+        changes[dotted_path] = valid_value  # noqa: PERF403
+
+    if changes:
+      self._schedule_save()
+      for dotted_path, valid_value in changes.items():
+        self._notify(dotted_path, valid_value)
+      self.emit("changed-bulk", changes)
+
+  def flush(self) -> None:
+    """Writes pending changes to the user schema file immediately
+
+    `set()` doesn't write the file itself: the write happens once no changes were made
+    for a short period, so a burst of changes (typing, dragging a slider) results in a
+    single write. The tradeoff is that changes made just before a crash, or during a
+    long uninterrupted burst, may not be on disk yet.
+
+    This is called automatically on interpreter exit, call it manually if the file must
+    be up to date earlier, e.g. in `Gtk.Application.do_shutdown`
+    """
+    if self._save_source:
+      GLib.source_remove(self._save_source)
+      self._save_source = 0
       self._save()
-      self.emit("changed", dotted_path, valid_value)
 
-  def bind(  # noqa: ANN201
+  def bind(
     self,
     dotted_path: str,
     target: GObject.Object,
@@ -66,7 +214,7 @@ class Schema(GObject.GObject):
     transform_to: Optional[Transform] = None,
     transform_from: Optional[Transform] = None,
     preserve_cursor: bool = False,
-  ):
+  ) -> Optional["_Binding"]:
     """Bounds given keypath to a given GObject.Object property
 
     Parameters
@@ -101,132 +249,150 @@ class Schema(GObject.GObject):
     if target.find_property(prop) is None:
       raise AttributeError(f"{type(target).__name__} has no GObject property '{prop}'")
 
+    # Resolved once here, so notify handlers don't walk the data on every change
+    node, key = self._resolve(dotted_path)
+    # Property accessors bound once instead of looking them up on `target` per change
+    get_prop = functools.partial(target.get_property, prop)
+    set_prop = functools.partial(target.set_property, prop)
+
     if sync_create:
-      value = self.get(dotted_path)
+      value = node[key]
       if transform_to:
         value = transform_to(value)
-      target.set_property(prop, value)
+      set_prop(value)
 
-    def on_schema_changed(_schema, changed_key: str, value: Any):
-      if changed_key != dotted_path:
-        return
+    def on_schema_changed(value: Any) -> None:
       if transform_to:
         value = transform_to(value)
-      target.set_property(prop, value)
+      set_prop(value)
 
     if not preserve_cursor:
-      handler_schema = self.connect("changed", on_schema_changed)
+      self._subs[dotted_path].append(on_schema_changed)
 
     handler_widget = None
     if bidirectional:
 
       def on_widget_notify(_obj, _pspec):
-        wvalue = target.get_property(prop)
+        wvalue = get_prop()
         if transform_from:
           wvalue = transform_from(wvalue)
-        self.set(dotted_path, wvalue)
+        self._set_resolved(dotted_path, node, key, wvalue)
 
       handler_widget = target.connect(f"notify::{prop}", on_widget_notify)
 
     if not preserve_cursor:
 
-      class Binding:
-        def unbind(_self):  # noqa: N805
-          self.disconnect(handler_schema)
-          if handler_widget:
-            target.disconnect(handler_widget)
+      def disconnect() -> None:
+        self._subs[dotted_path].remove(on_schema_changed)
+        if handler_widget:
+          target.disconnect(handler_widget)
 
-      return Binding()
+      return _Binding(disconnect)
+    return None
 
   @staticmethod
   def _load_yaml_from_resource(resource_path: str) -> dict[str, Any]:
-    gfile = Gio.File.new_for_uri(f"resource://{resource_path}")
-    _, contents, __ = gfile.load_contents(None)
-    return yaml.safe_load(contents.decode()) or {}
-
-  def _load_or_create_user_data(self, path: Path) -> dict[str, Any]:
-    if path.exists():
-      try:
-        with path.open("r", encoding="utf-8") as f:
-          return json.load(f)
-      except Exception:
-        return {}
-    path.parent.mkdir(parents=True, exist_ok=True)
-    return {}
+    # A JSON copy of the schema bundled next to the YAML one is preferred, since it is
+    # parsed much faster. YAML stays the authoring format and the fallback
+    json_path = str(PurePosixPath(resource_path).with_suffix(".json"))
+    try:
+      contents = Gio.resources_lookup_data(
+        json_path, Gio.ResourceLookupFlags.NONE
+      ).get_data()
+    except GLib.Error:
+      pass
+    else:
+      return _loads(contents or b"{}") or {}
+
+    contents = Gio.resources_lookup_data(
+      resource_path, Gio.ResourceLookupFlags.NONE
+    ).get_data()
+    return yaml.load(contents or b"", Loader=_YamlLoader) or {}
+
+  def _load_or_create_user_data(self, path: Path) -> tuple[Any, bool]:
+    # Returns the user data and whether the file has to be rewritten in the current format
+    if not path.exists():
+      path.parent.mkdir(parents=True, exist_ok=True)
+      return {}, False
+    try:
+      contents = path.read_bytes()
+    except OSError:  # unreadable, e.g. no permission or a directory
+      return {}, False
+    with contextlib.suppress(Exception):
+      data = self._loads(contents)
+      if isinstance(data, dict) or self._loads is _loads:
+        return data, False
+    if self._loads is not _loads:
+      # A JSON file written before `binary_format` was turned on, kept and converted
+      with contextlib.suppress(Exception):
+        return _loads(contents), True
+    return {}, False
+
+  def _schedule_save(self) -> None:
+    # Restart the countdown on every change, so the write happens after changes settle
+    if self._save_source:
+      GLib.source_remove(self._save_source)
+    self._save_source = GLib.timeout_add(_SAVE_DELAY_MS, self._on_save_timeout)
+
+  def _on_save_timeout(self) -> bool:
+    self._save_source = 0
+    self._save()
+    return GLib.SOURCE_REMOVE
 
   def _save(self) -> None:
-    with self._path.open("w", encoding="utf-8") as f:
-      json.dump(self._data, f, indent=2)
-
-  def _apply_validation_and_cleanup(
-    self, user_data: dict[str, Any], rules: dict[str, Any]
-  ) -> tuple[dict[str, Any], bool]:
-    changed = False
-
-    def walk(rule_node: dict[str, Any], data_node: dict[str, Any]) -> dict[str, Any]:
-      nonlocal changed
-      corrected: dict[str, Any] = {}
-
-      for name, rule in rule_node.items():
-        if _is_leaf_rule(rule):
-          # leaf setting with constraints
-          value = data_node.get(name, rule.get("default"))
-          valid_value, was_changed = self._validate_leaf(rule, value)
-          if was_changed:
-            changed = True
-          corrected[name] = valid_value
-        else:
-          # nested group
-          child_data = data_node.get(name, {})
-          if not isinstance(child_data, dict):
-            child_data = {}
-            changed = True
-          corrected[name] = walk(rule, child_data)
-
-      for _extra in data_node.keys() - rule_node.keys():
-        changed = True  # cleanup
-      return corrected
-
-    corrected_root = walk(rules, user_data if isinstance(user_data, dict) else {})
-    return corrected_root, changed
-
-  def _validate_leaf(self, rule: dict[str, Any], value: Any) -> tuple[Any, bool]:
-    expected_type = rule.get("type")
-    default_value = rule.get("default")
-    changed = False
-
-    pytype = {"int": int, "str": str, "bool": bool, "float": float}.get(
-      expected_type, type(default_value)
-    )
-    if not isinstance(value, pytype):
-      value = default_value
-      changed = True
-
-    if expected_type in ("int", "float"):
-      if "min" in rule and value < rule["min"]:
-        value = default_value
-        changed = True
-      if "max" in rule and value > rule["max"]:
-        value = default_value
-        changed = True
-
-    if "enum" in rule and value not in rule["enum"]:
-      value = default_value
-      changed = True
+    # Write to a sibling file and swap it in, so the file is never left half-written
+    tmp_path = self._path.with_name(f".{self._path.name}.tmp")
+    tmp_path.write_bytes(self._dumps(self._data))
+    tmp_path.replace(self._path)
+
+  def _set_resolved(
+    self, dotted_path: str, node: dict[str, Any], key: str, value: Any
+  ) -> None:
+    valid_value = self._validate_single_value(dotted_path, value)
+    if self._store(node, key, valid_value):
+      self._schedule_save()
+      self._notify(dotted_path, valid_value)
 
-    return value, changed
+  @staticmethod
+  def _store(node: dict[str, Any], key: str, valid_value: Any) -> bool:
+    # Stores an already validated value, telling if it differs from the stored one
+    current = node.get(key)
+    # Identity first, so setting the stored object again skips the `__eq__` call
+    if current is valid_value or current == valid_value:
+      return False
+    node[key] = valid_value
+    return True
+
+  def _notify(self, dotted_path: str, value: Any) -> None:
+    if subs := self._subs.get(dotted_path):
+      for callback in tuple(subs):  # a callback may unbind while iterating
+        try:
+          callback(value)
+        except Exception:
+          # Reported the way PyGObject reports failing signal handlers, so one broken
+          # binding doesn't stop the other ones and the `changed` emission
+          sys.excepthook(*sys.exc_info())
+    self.emit("changed", dotted_path, value)
 
   def _validate_single_value(self, dotted_path: str, value: Any) -> Any:
-    rule_node, key = self._resolve_parent_and_key(self._rules, dotted_path)
-    rule = rule_node[key]
-    validated, _ = self._validate_leaf(rule, value)
+    validated, _ = self._flat_rules[dotted_path](value)
     return validated
 
+  def _resolve(self, dotted_path: str) -> tuple[dict[str, Any], str]:
+    # Group dicts are never replaced once validated, so a leaf's parent is resolved once
+    # and then looked up directly instead of being walked to on every get/set
+    resolved = self._leaf_nodes.get(dotted_path)
+    if resolved is None:
+      resolved = self._resolve_parent_and_key(self._data, dotted_path)
+      if dotted_path in self._flat_rules:
+        self._leaf_nodes[dotted_path] = resolved
+    return resolved
+
   @staticmethod
   def _resolve_parent_and_key(
     root: dict[str, Any], dotted_path: str
   ) -> tuple[dict[str, Any], str]:
-    parts = dotted_path.split(".")
+    parts = _split_path(dotted_path)
     if not parts:
       raise KeyError("Empty dotted path")
 
@@ -238,5 +404,124 @@ class Schema(GObject.GObject):
     return node, parts[-1]
 
 
+@functools.lru_cache(maxsize=256)
+def _split_path(dotted_path: str) -> tuple[str, ...]:
+  return tuple(dotted_path.split("."))
+
+
 def _is_leaf_rule(rule: Any) -> bool:
   return isinstance(rule, dict) and ("type" in rule)
+
+
+def _compile_leaf(rule: dict[str, Any]) -> LeafValidator:
+  """Builds a validator specialized for a single leaf rule.
+
+  The returned callable takes a value and returns it along with `False` if it satisfies
+  the rule, or the rule default along with `True` otherwise.
+  """
+  expected_type = rule.get("type")
+  default_value = rule.get("default")
+  pytype = _TYPE_MAP.get(expected_type, type(default_value))
+  numeric = expected_type in ("int", "float")
+  has_min = numeric and "min" in rule
+  has_max = numeric and "max" in rule
+  minimum = rule.get("min")
+  maximum = rule.get("max")
+  has_enum = "enum" in rule
+  enum = rule.get("enum")
+  if has_enum:
+    # Hashed membership test instead of scanning the list; the rule itself keeps the
+    # original ordered list
+    with contextlib.suppress(TypeError):  # unhashable choices keep the linear scan
+      enum = frozenset(enum)
+
+  def validate(value: Any) -> tuple[Any, bool]:
+    if (
+      # Exact type: `bool` is an `int` subclass and must not pass for `int` rules
+      type(value) is not pytype
+      or (has_min and value < minimum)
+      or (has_max and value > maximum)
+      or (has_enum and value not in enum)
+    ):
+      return default_value, True
+    return value, False
+
+  return validate
+
+
+def _compile_validator(
+  rules: dict[str, Any],
+  flat_rules: Optional[dict[str, LeafValidator]] = None,
+  prefix: str = "",
+) -> Validator:
+  """Builds a validator for a rules group, compiling nested groups and leaves once.
+
+  The returned callable takes user data for the group and returns the corrected data
+  along with a flag telling if anything had to be corrected or cleaned up.
+
+  If `flat_rules` is given, every compiled leaf validator is also stored there under
+  its full dotted path.
+  """
+  fields: list[tuple[str, bool, Callable, Any]] = []
+  for name, rule in rules.items():
+    path = f"{prefix}{name}"
+    if _is_leaf_rule(rule):
+      leaf = _compile_leaf(rule)
+      if flat_rules is not None:
+        flat_rules[path] = leaf
+      fields.append((name, True, leaf, rule.get("default")))
+    else:
+      group = _compile_validator(rule, flat_rules, f"{path}.")
+      fields.append((name, False, group, None))
+  rule_keys = rules.keys()
+
+  def validate(data_node: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+    changed = False
+    # Already valid data (every launch after the first one) is returned as is: the
+    # corrected copy is only started at the first field that differs from the user data
+    corrected: Optional[dict[str, Any]] = None if data_node.keys() == rule_keys else {}
+
+    for index, (name, is_leaf, validator, default) in enumerate(fields):
+      if is_leaf:
+        # leaf setting with constraints
+        current = data_node.get(name, default)
+        value, was_changed = validator(current)
+      else:
+        # nested group
+        current = data_node.get(name, {})
+        child_data = current if isinstance(current, dict) else {}
+        if child_data is not current:
+          changed = True
+        value, was_changed = validator(child_data)
+      if was_changed:
+        changed = True
+      if corrected is None:
+        if value is current and not was_changed:
+          continue
+        # Fields before this one were all kept as is
+        corrected = {field[0]: data_node[field[0]] for field in fields[:index]}
+      corrected[name] = value
+
+    if corrected is None:
+      return data_node, False
+    # `<=` on key views checks containment without building a difference set
+    if not data_node.keys() <= rule_keys:
+      changed = True  # cleanup
+    return corrected, changed
+
+  return validate
+
+
+class _Binding:
+  """A `Schema.bind()` result, undoes the binding on `unbind()`"""
+
+  __slots__ = ("_disconnect",)
+
+  def __init__(self, disconnect: Callable[[], None]) -> None:
+    self._disconnect: Optional[Callable[[], None]] = disconnect
+
+  def unbind(self) -> None:
+    # Repeated calls do nothing
+    disconnect, self._disconnect = self._disconnect, None
+    if disconnect is not None:
+      disconnect()
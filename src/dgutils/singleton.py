@@ -1,23 +1,30 @@
 from __future__ import annotations
 
-from typing import cast
+from threading import RLock
 
 import gi
 from gi.repository import GObject
 
+# Guards instance creation only; re-entrant so a singleton's `__init__` may create other
+# singletons
+_lock = RLock()
+
 
 class GSingleton(gi.types.GObjectMeta):  # ty:ignore[unresolved-attribute]
   """A metaclass used to create singleton objects for GObjects, saving support for
   staticmethods and classmethods
   """  # noqa: D205
 
-  _instances = {}
-
   def __call__[T: GObject.Object](cls: type[T], *args, **kwargs) -> T:  # noqa: N805
-    if cls not in GSingleton._instances:
-      instance = super().__call__(*args, **kwargs)  # ty:ignore[invalid-super-argument]
-      GSingleton._instances[cls] = instance
-    return cast("T", GSingleton._instances[cls])
+    # Looked up in the class' own namespace, so subclasses get their own instance
+    instance = cls.__dict__.get("__singleton_instance__")
+    if instance is None:
+      with _lock:
+        instance = cls.__dict__.get("__singleton_instance__")
+        if instance is None:
+          instance = super().__call__(*args, **kwargs)  # ty:ignore[invalid-super-argument]
+          cls.__singleton_instance__ = instance  # ty:ignore[unresolved-attribute]
+    return instance
 
 
 class Singleton(type):
@@ -25,10 +32,13 @@ class Singleton(type):
   and classmethods
   """  # noqa: D205
 
-  _instances = {}
-
   def __call__[T: object](cls: type[T], *args, **kwargs) -> T:
-    if cls not in Singleton._instances:
-      instance = super().__call__(*args, **kwargs)  # ty:ignore[invalid-super-argument]
-      Singleton._instances[cls] = instance
-    return Singleton._instances[cls]
+    # Looked up in the class' own namespace, so subclasses get their own instance
+    instance = cls.__dict__.get("__singleton_instance__")
+    if instance is None:
+      with _lock:
+        instance = cls.__dict__.get("__singleton_instance__")
+        if instance is None:
+          instance = super().__call__(*args, **kwargs)  # ty:ignore[invalid-super-argument]
+          cls.__singleton_instance__ = instance  # ty:ignore[unresolved-attribute]
+    return instance
@@ -51,6 +51,9 @@ def unwrap_or_call[T](
 ) -> T:
   """Unwraps the given object and returns it if it's not None, else calls the default callable to get the value.
 
+  Use `unwrap_or_else` if the default callable takes no arguments, it skips packing
+  them on every call.
+
   Parameters
   ----------
   obj : Optional[T]
@@ -68,11 +71,32 @@ def unwrap_or_call[T](
   return obj
 
 
+def unwrap_or_else[T](obj: Optional[T], default: Callable[[], T]) -> T:
+  """Unwraps the given object and returns it if it's not None, else calls the default callable without arguments to get the value.
+
+  Parameters
+  ----------
+  obj : Optional[T]
+    An object which should be unwrapped
+  default : Callable[[], T]
+    A callable that returns a default value
+
+  Returns
+  -------
+  T
+    Given object if not None, else the result of calling the default callable
+  """
+  return obj if obj is not None else default()
+
+
 def unwrap_or_execute[T](
   obj: Optional[T], call: Callable[[Any], Any], *args, **kwargs
 ) -> Optional[T]:
   """Unwraps the given object and returns it if it's not None, else calls the provided callable with provided args and kwargs
 
+  Use `unwrap_or_run` if the callable takes no arguments, it skips packing them on
+  every call.
+
   Returns
   -------
   T
@@ -81,3 +105,16 @@ def unwrap_or_execute[T](
   if obj is None:
     call(*args, **kwargs)
   return obj
+
+
+def unwrap_or_run[T](obj: Optional[T], call: Callable[[], Any]) -> Optional[T]:
+  """Unwraps the given object and returns it if it's not None, else calls the provided callable without arguments
+
+  Returns
+  -------
+  T
+    Given object if not None
+  """
+  if obj is None:
+    call()
+  return obj